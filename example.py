@@ -10,32 +10,45 @@ async def main():
     async with QStreamClient("192.168.1.165") as client:
         print("=== QStream Device Status ===\n")
 
-        # Get current status
-        status = await client.get_status()
-        print(f"Current speed: {status.actual_flow}%")
-        print(f"Target speed: {status.set_flow}%")
-        print(f"Timer active: {status.timer_active}")
-        print(f"Schedule enabled: {status.schedule_enabled}")
-        print(f"Demand control: {status.demand_control_enabled}")
-        print(f"Valve: {'OPEN' if status.valve_open else 'CLOSED'}")
-
-        # Get air quality
-        aqi = await client.get_air_quality()
-        print(f"\nAir quality index: {aqi}")
-
-        # Get nominal flow rate
-        qnom = await client.get_nominal_flow()
-        print(f"Nominal flow rate: {qnom}")
-
-        # Get preset levels
+        # The reads are independent, so issue them concurrently
+        status, aqi, qnom, *levels = await asyncio.gather(
+            client.get_status(),
+            client.get_air_quality(),
+            client.get_nominal_flow(),
+            *(client.get_level(i) for i in range(1, 5)),
+            return_exceptions=True,
+        )
+
+        # Current status
+        if isinstance(status, Exception):
+            print(f"Status: Error - {status}")
+        else:
+            print(f"Current speed: {status.actual_flow}%")
+            print(f"Target speed: {status.set_flow}%")
+            print(f"Timer active: {status.timer_active}")
+            print(f"Schedule enabled: {status.schedule_enabled}")
+            print(f"Demand control: {status.demand_control_enabled}")
+            print(f"Valve: {'OPEN' if status.valve_open else 'CLOSED'}")
+
+        # Air quality
+        if isinstance(aqi, Exception):
+            print(f"\nAir quality index: Error - {aqi}")
+        else:
+            print(f"\nAir quality index: {aqi}")
+
+        # Nominal flow rate
+        if isinstance(qnom, Exception):
+            print(f"Nominal flow rate: Error - {qnom}")
+        else:
+            print(f"Nominal flow rate: {qnom}")
+
+        # Preset levels
         print("\nPreset levels:")
-        for i in range(1, 5):
-            try:
-                level = await client.get_level(i)
+        for i, level in enumerate(levels, start=1):
+            if isinstance(level, Exception):
+                print(f"  Level {i}: Error - {level}")
+            else:
                 print(f"  Level {i}: {level}%")
-                await asyncio.sleep(0.2)  # Small delay between requests
-            except Exception as e:
-                print(f"  Level {i}: Error - {e}")
 
         print("\n=== Example Complete ===")
 
@@ -1,7 +1,7 @@
 """Async Python library for BUVA QStream 2.0 ventilation fan control."""
 
 from qstream.client import QStreamClient
-from qstream.models import QStreamStatus, ScheduleMode
+from qstream.models import QStreamSnapshot, QStreamStatus, ScheduleMode
 from qstream.exceptions import (
     QStreamError,
     QStreamConnectionError,
@@ -14,6 +14,7 @@ __version__ = "0.1.0"
 __all__ = [
     "QStreamClient",
     "QStreamStatus",
+    "QStreamSnapshot",
     "ScheduleMode",
     "QStreamError",
     "QStreamConnectionError",
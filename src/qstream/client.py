@@ -1,21 +1,122 @@
 """Async HTTP client for BUVA QStream 2.0 ventilation fans."""
 
+import asyncio
+import inspect
+import re
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Self
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, ClassVar, Self
 import aiohttp
+from yarl import URL
 
 from qstream.exceptions import (
     QStreamConnectionError,
     QStreamTimeoutError,
     QStreamResponseError,
 )
-from qstream.models import QStreamStatus
+from qstream.models import QStreamSnapshot, QStreamStatus
 from qstream.parser import parse_status
 
+# Use orjson for JSON encoding/decoding when installed (qstream[speedups])
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+except ImportError:
+    import json
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        """Serialize a request body to compact UTF-8 encoded JSON (like orjson)."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Keep idle connections open across typical 10-60s poll intervals
+# (matches the common 75s server-side default)
+_KEEPALIVE_TIMEOUT = 75
+
+# Cache resolved hostnames (e.g. mDNS "qstream.local") between polls
+_DNS_CACHE_TTL = 600
+
+# Fast path for the device's {"Value": "..."} bodies; escaped strings are
+# left to the JSON decoder
+_VALUE_RE = re.compile(rb'"Value"\s*:\s*"([^"\\]*)"')
+
+
+@lru_cache(maxsize=32)
+def _build_timer_payload(
+    duration_minutes: int, speed_percentage: int, demand_control: bool
+) -> bytes:
+    """Build the encoded /Timer request body for a timer preset.
+
+    Automations tend to fire the same presets repeatedly, so the encoded
+    body is cached per (duration, speed, demand control) combination.
+    """
+    demand = "ON" if demand_control else "OFF"
+    # Mode doesn't matter for timer command, use NIGHT as default
+    command = f"TIMER {duration_minutes} MIN {speed_percentage}% DEMAND CONTROL {demand} NIGHT"
+    return _json_dumps({"Value": command})
+
+
+_CANCEL_TIMER_PAYLOAD = _json_dumps({"Value": "TIMER 0 MIN"})
+
+
+@dataclass(slots=True)
+class _WriteBuffer:
+    """Writes buffered by one QStreamClient.batch() block, keyed by URL."""
+
+    writes: dict[URL, bytes] = field(default_factory=dict)
+    closed: bool = False
+
+
+# Open batch buffers per client, visible only to the task running the
+# batch block (and tasks it starts). Replaced, never mutated, on entry.
+_batch_buffers: ContextVar[Mapping["QStreamClient", _WriteBuffer]] = ContextVar(
+    "qstream_batch_buffers"
+)
+_NO_BATCH_BUFFERS: Mapping["QStreamClient", _WriteBuffer] = MappingProxyType({})
+
 
 class QStreamClient:
     """Async HTTP client for QStream 2.0 devices."""
 
+    __slots__ = (
+        "_base_url",
+        "_host",
+        "_last_status",
+        "_last_status_body",
+        "_owned_session",
+        "_request_options",
+        "_session",
+        "_timeout",
+        "_url_aqi",
+        "_url_datetime",
+        "_url_levels",
+        "_url_qnom",
+        "_url_status",
+        "_url_timer",
+    )
+
+    # Process-wide session handed out by shared_session()
+    _shared_session: ClassVar[aiohttp.ClientSession | None] = None
+    _shared_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    # Closes of stale shared sessions still in flight (keeps the tasks alive)
+    _closing_tasks: ClassVar[set[asyncio.Task[None]]] = set()
+
     def __init__(
         self,
         host: str,
@@ -34,10 +135,121 @@ class QStreamClient:
             host = f"http://{host}"
         self._host = host.rstrip("/")
 
+        # Endpoint URLs are parsed once, so aiohttp can use them as-is
+        self._base_url = URL(self._host)
+        self._url_status = self._base_url / "Status"
+        self._url_aqi = self._base_url / "AQI"
+        self._url_qnom = self._base_url / "Qnom"
+        self._url_datetime = self._base_url / "DateTime"
+        self._url_timer = self._base_url / "Timer"
+        self._url_levels = tuple(
+            (self._base_url / "Levels").with_query(index=i) for i in range(5)
+        )
+
         self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._session = session
         self._owned_session = session is None
 
+        # Owned sessions carry the timeout; external ones need it per request
+        self._request_options: dict[str, Any] = (
+            {} if self._owned_session else {"timeout": self._timeout}
+        )
+
+        # Last /Status body and its parsed result, to skip re-parsing
+        self._last_status_body: bytes | None = None
+        self._last_status: QStreamStatus | None = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the owned session with a keep-alive connection pool.
+
+        All requests go to a single device, so a small pool of long-lived
+        connections avoids a new TCP handshake per request. Must be called
+        from within a running event loop.
+
+        Returns:
+            New session using the client's timeout
+        """
+        connector = aiohttp.TCPConnector(
+            limit=8,
+            limit_per_host=8,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+            force_close=False,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+
+    @classmethod
+    def shared_session(cls) -> aiohttp.ClientSession:
+        """Return a session shared by all clients in this process.
+
+        Pass it as the session argument to reuse one connection pool (and
+        its keep-alive connections) across several clients, e.g. one per
+        device. Clients do not close the shared session; call
+        close_shared_session() on shutdown. Must be called from within a
+        running event loop. A session left open by an event loop that has
+        since closed (e.g. a previous asyncio.run()) is closed and replaced.
+
+        Returns:
+            Shared aiohttp session bound to the running event loop
+
+        Raises:
+            RuntimeError: The open shared session belongs to another event
+                loop that is still running
+        """
+        loop = asyncio.get_running_loop()
+        session = cls._shared_session
+        owner = cls._shared_loop
+        if session is not None and not session.closed and owner is not loop:
+            if owner is not None and not owner.is_closed():
+                raise RuntimeError(
+                    "The shared QStream session belongs to another event loop; "
+                    "call close_shared_session() from that loop first"
+                )
+            # Its loop is gone, so release the session from this one
+            task = loop.create_task(session.close())
+            cls._closing_tasks.add(task)
+            task.add_done_callback(cls._closing_tasks.discard)
+            session = None
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            cls._shared_session = session
+            cls._shared_loop = loop
+        return session
+
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """Close the session returned by shared_session(), if any."""
+        session = cls._shared_session
+        cls._shared_session = None
+        cls._shared_loop = None
+        if session is not None:
+            await session.close()
+
+    @classmethod
+    def sync(cls, host: str, timeout: int = 10) -> "_SyncClient":
+        """Return a blocking client for use from synchronous code.
+
+        The returned wrapper exposes the same methods without await and
+        keeps one event loop (and the client's connection pool) alive
+        across calls, instead of paying asyncio.run() setup per call. Use
+        it as a context manager or call close() when done. It cannot be
+        used from within a running event loop.
+
+        Args:
+            host: Device IP or hostname (e.g., "192.168.1.100")
+            timeout: Request timeout in seconds
+
+        Returns:
+            Synchronous wrapper around a new client
+        """
+        return _SyncClient(cls(host, timeout=timeout))
+
     async def close(self) -> None:
         """Close the client session if owned."""
         if self._owned_session and self._session:
@@ -45,20 +257,27 @@ class QStreamClient:
 
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
+        if self._session is None:
+            self._session = self._create_session()
         return self
 
     async def __aexit__(self, *args) -> None:
         """Async context manager exit."""
         await self.close()
 
-    async def _get_json(self, endpoint: str) -> dict:
-        """Make GET request and return JSON response.
+    async def _request(self, method: str, url: URL, **kwargs: Any) -> bytes:
+        """Make HTTP request and return the raw response body.
+
+        The body is returned undecoded; skipping response.json() avoids
+        aiohttp's content-type check and charset detection.
 
         Args:
-            endpoint: API endpoint path (e.g., "/Status")
+            method: HTTP method (e.g., "GET")
+            url: Full endpoint URL (e.g., "http://192.168.1.100/AQI")
+            **kwargs: Extra arguments for the session request
 
         Returns:
-            JSON response as dictionary
+            Response body as bytes
 
         Raises:
             QStreamConnectionError: Cannot connect to device
@@ -66,14 +285,14 @@ class QStreamClient:
             QStreamResponseError: Invalid response format
         """
         if not self._session:
-            self._session = aiohttp.ClientSession()
-
-        url = f"{self._host}{endpoint}"
+            self._session = self._create_session()
 
         try:
-            async with self._session.get(url, timeout=self._timeout) as response:
+            async with self._session.request(
+                method, url, **kwargs, **self._request_options
+            ) as response:
                 response.raise_for_status()
-                return await response.json()
+                return await response.read()
         except aiohttp.ClientConnectionError as e:
             raise QStreamConnectionError(f"Cannot connect to {url}") from e
         except aiohttp.ClientResponseError as e:
@@ -82,8 +301,128 @@ class QStreamClient:
             ) from e
         except TimeoutError as e:
             raise QStreamTimeoutError(f"Request to {url} timed out") from e
-        except Exception as e:
-            raise QStreamResponseError(f"Unexpected error: {e}") from e
+        except aiohttp.ClientError as e:
+            raise QStreamResponseError(f"Invalid response from {url}: {e}") from e
+
+    async def _get_value(self, url: URL, default: str) -> str:
+        """Make GET request and return the "Value" field of the response.
+
+        Args:
+            url: Full endpoint URL (e.g., "http://192.168.1.100/AQI")
+            default: Value to return if the response has no "Value" field
+
+        Returns:
+            The "Value" field of the response
+
+        Raises:
+            QStreamConnectionError: Cannot connect to device
+            QStreamTimeoutError: Request timed out
+            QStreamResponseError: Invalid response format
+        """
+        body = await self._request("GET", url)
+        return self._extract_value(url, body, default)
+
+    async def _get_int(
+        self, url: URL, default: str, name: str, *, percent: bool = False
+    ) -> int:
+        """Make GET request and parse the "Value" field as an integer.
+
+        Args:
+            url: Full endpoint URL
+            default: Value to use if the response has no "Value" field
+            name: Human-readable value name for error messages
+            percent: Strip trailing "%" signs before parsing
+
+        Returns:
+            The parsed integer value
+
+        Raises:
+            QStreamConnectionError: Cannot connect to device
+            QStreamTimeoutError: Request timed out
+            QStreamResponseError: Invalid response format
+        """
+        value = await self._get_value(url, default)
+        try:
+            return int(value.rstrip("%") if percent else value)
+        except ValueError as e:
+            raise QStreamResponseError(
+                f"Invalid {name} value: {value}", raw_response=value
+            ) from e
+
+    @classmethod
+    def _extract_value(cls, url: URL, body: bytes, default: str) -> str:
+        """Extract the "Value" field from a raw response body.
+
+        The value is sliced out with a regex, skipping the JSON decoder;
+        bodies the regex does not match are decoded as JSON.
+
+        Args:
+            url: Endpoint URL the body was returned from
+            body: Raw response body
+            default: Value to return if the response has no "Value" field
+
+        Returns:
+            The "Value" field of the response
+
+        Raises:
+            QStreamResponseError: Invalid response format
+        """
+        # Empty bodies (e.g. 204 No Content) carry no value to decode
+        if not body:
+            return default
+
+        match = _VALUE_RE.search(body)
+        if match:
+            try:
+                return match.group(1).decode()
+            except UnicodeDecodeError as e:
+                raise QStreamResponseError(
+                    f"Invalid UTF-8 in response from {url}",
+                    raw_response=body.decode(errors="replace"),
+                ) from e
+
+        data = cls._decode_json(url, body)
+        if not isinstance(data, dict):
+            raise QStreamResponseError(
+                f"Unexpected JSON response from {url}",
+                raw_response=body.decode(errors="replace"),
+            )
+
+        value = data.get("Value", default)
+        if isinstance(value, str):
+            return value
+
+        # Normalize numbers (e.g. {"Value": 38}) so callers can always parse
+        # the text form; anything else (null, bool, object) is not a reading
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+
+        raise QStreamResponseError(
+            f"Unexpected Value in response from {url}",
+            raw_response=body.decode(errors="replace"),
+        )
+
+    @staticmethod
+    def _decode_json(url: URL, body: bytes) -> Any:
+        """Decode a raw JSON response body.
+
+        Args:
+            url: Endpoint URL the body was returned from
+            body: Raw response body
+
+        Returns:
+            Decoded JSON value
+
+        Raises:
+            QStreamResponseError: Body is not valid JSON
+        """
+        try:
+            return _json_loads(body)
+        except ValueError as e:
+            raise QStreamResponseError(
+                f"Invalid JSON response from {url}",
+                raw_response=body.decode(errors="replace"),
+            ) from e
 
     async def get_status(self) -> QStreamStatus:
         """Get current device status.
@@ -96,9 +435,15 @@ class QStreamClient:
             QStreamTimeoutError: Request timed out
             QStreamResponseError: Invalid response format
         """
-        data = await self._get_json("/Status")
-        raw_value = data.get("Value", "")
-        return parse_status(raw_value)
+        body = await self._request("GET", self._url_status)
+        # Unchanged device state returns the previously parsed status
+        if self._last_status is not None and body == self._last_status_body:
+            return self._last_status
+
+        status = parse_status(self._extract_value(self._url_status, body, ""))
+        self._last_status_body = body
+        self._last_status = status
+        return status
 
     async def get_air_quality(self) -> int:
         """Get air quality index.
@@ -111,13 +456,7 @@ class QStreamClient:
             QStreamTimeoutError: Request timed out
             QStreamResponseError: Invalid response format
         """
-        data = await self._get_json("/AQI")
-        try:
-            return int(data.get("Value", "0"))
-        except (ValueError, TypeError) as e:
-            raise QStreamResponseError(
-                f"Invalid AQI value: {data}", raw_response=str(data)
-            ) from e
+        return await self._get_int(self._url_aqi, "0", "AQI")
 
     async def get_nominal_flow(self) -> str:
         """Get nominal flow rate.
@@ -129,8 +468,7 @@ class QStreamClient:
             QStreamConnectionError: Cannot connect to device
             QStreamTimeoutError: Request timed out
         """
-        data = await self._get_json("/Qnom")
-        return data.get("Value", "0%")
+        return await self._get_value(self._url_qnom, "0%")
 
     async def get_datetime(self) -> datetime:
         """Get device date and time.
@@ -143,10 +481,36 @@ class QStreamClient:
             QStreamTimeoutError: Request timed out
             QStreamResponseError: Invalid datetime format
         """
-        data = await self._get_json("/DateTime")
-        dt_string = data.get("Value", "")
+        dt_string = await self._get_value(self._url_datetime, "")
+        # Fixed-width "dd/mm/YYYY HH:MM:SS"; slicing avoids strptime overhead
+        fields = (
+            dt_string[6:10],
+            dt_string[3:5],
+            dt_string[0:2],
+            dt_string[11:13],
+            dt_string[14:16],
+            dt_string[17:19],
+        )
         try:
-            return datetime.strptime(dt_string, "%d/%m/%Y %H:%M:%S")
+            # int() would also accept signs and non-ASCII digits
+            if (
+                len(dt_string) != 19
+                or (
+                    dt_string[2],
+                    dt_string[5],
+                    dt_string[10],
+                    dt_string[13],
+                    dt_string[16],
+                )
+                != ("/", "/", " ", ":", ":")
+                or not dt_string.isascii()
+                or not all(field.isdigit() for field in fields)
+            ):
+                raise ValueError("unexpected datetime layout")
+            year, month, day, hour, minute, second = fields
+            return datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second)
+            )
         except ValueError as e:
             raise QStreamResponseError(
                 f"Invalid datetime format: {dt_string}", raw_response=dt_string
@@ -166,51 +530,111 @@ class QStreamClient:
             QStreamTimeoutError: Request timed out
             QStreamResponseError: Invalid response format
         """
-        data = await self._get_json(f"/Levels?index={index}")
-        value_str = data.get("Value", "0%")
-        try:
-            return int(value_str.rstrip("%"))
-        except ValueError as e:
-            raise QStreamResponseError(
-                f"Invalid level value: {value_str}", raw_response=value_str
-            ) from e
+        if 0 <= index < len(self._url_levels):
+            url = self._url_levels[index]
+        else:
+            url = (self._base_url / "Levels").with_query(index=index)
+        return await self._get_int(url, "0%", "level", percent=True)
 
-    async def _post_json(self, endpoint: str, data: dict) -> dict:
-        """Make POST request with JSON body.
+    async def get_all_levels(self, count: int = 5) -> list[int]:
+        """Get preset level percentages concurrently.
 
         Args:
-            endpoint: API endpoint path (e.g., "/Timer")
-            data: JSON data to send
+            count: Number of levels to fetch, starting at index 0
 
         Returns:
-            JSON response as dictionary
+            Level percentages (0-100), indexed by level
 
         Raises:
             QStreamConnectionError: Cannot connect to device
             QStreamTimeoutError: Request timed out
             QStreamResponseError: Invalid response format
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+        return list(await asyncio.gather(*(self.get_level(i) for i in range(count))))
+
+    async def snapshot(self) -> QStreamSnapshot:
+        """Get status, air quality, nominal flow and datetime concurrently.
+
+        Returns:
+            Combined device readings
+
+        Raises:
+            QStreamConnectionError: Cannot connect to device
+            QStreamTimeoutError: Request timed out
+            QStreamResponseError: Invalid response format
+        """
+        status, air_quality, nominal_flow, device_datetime = await asyncio.gather(
+            self.get_status(),
+            self.get_air_quality(),
+            self.get_nominal_flow(),
+            self.get_datetime(),
+        )
+        return QStreamSnapshot(
+            status=status,
+            air_quality=air_quality,
+            nominal_flow=nominal_flow,
+            device_datetime=device_datetime,
+        )
+
+    async def _post_json(self, url: URL, payload: bytes) -> None:
+        """Make POST request with an encoded JSON body.
+
+        The device only acknowledges writes, so the response body is read
+        to release the connection for keep-alive reuse but not decoded.
+        Inside a batch() block the write is buffered instead.
 
-        url = f"{self._host}{endpoint}"
+        Args:
+            url: Full endpoint URL (e.g., "http://192.168.1.100/Timer")
+            payload: UTF-8 encoded JSON body
 
+        Raises:
+            QStreamConnectionError: Cannot connect to device
+            QStreamTimeoutError: Request timed out
+            QStreamResponseError: Invalid response format
+        """
+        buffer = _batch_buffers.get(_NO_BATCH_BUFFERS).get(self)
+        if buffer is not None and not buffer.closed:
+            buffer.writes[url] = payload
+            return
+
+        await self._request("POST", url, data=payload, headers=_JSON_HEADERS)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Buffer write commands and send them together when the block exits.
+
+        Each write replaces the device state set by the previous write to
+        the same endpoint, so only the last write per endpoint is sent.
+        Writes to different endpoints are sent concurrently. Nothing is
+        sent if the block raises. Nested batches join the outer batch.
+
+        Only writes from the task running the block (and tasks it starts)
+        are buffered; other tasks sharing the client, and writes made after
+        the block exits, are sent immediately.
+
+        Raises:
+            QStreamConnectionError: Cannot connect to device
+            QStreamTimeoutError: Request timed out
+        """
+        buffers = _batch_buffers.get(_NO_BATCH_BUFFERS)
+        outer = buffers.get(self)
+        if outer is not None and not outer.closed:
+            yield
+            return
+
+        buffer = _WriteBuffer()
+        token = _batch_buffers.set({**buffers, self: buffer})
         try:
-            async with self._session.post(
-                url, json=data, timeout=self._timeout
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientConnectionError as e:
-            raise QStreamConnectionError(f"Cannot connect to {url}") from e
-        except aiohttp.ClientResponseError as e:
-            raise QStreamConnectionError(
-                f"HTTP {e.status} error from {url}"
-            ) from e
-        except TimeoutError as e:
-            raise QStreamTimeoutError(f"Request to {url} timed out") from e
-        except Exception as e:
-            raise QStreamResponseError(f"Unexpected error: {e}") from e
+            yield
+        finally:
+            # Tasks started in the block keep a reference to the buffer;
+            # closing it makes their later writes go out directly
+            buffer.closed = True
+            _batch_buffers.reset(token)
+
+        await asyncio.gather(
+            *(self._post_json(url, payload) for url, payload in buffer.writes.items())
+        )
 
     async def set_timer(
         self,
@@ -229,11 +653,10 @@ class QStreamClient:
             QStreamConnectionError: Cannot connect to device
             QStreamTimeoutError: Request timed out
         """
-        demand = "ON" if demand_control else "OFF"
-        # Mode doesn't matter for timer command, use NIGHT as default
-        command = f"TIMER {duration_minutes} MIN {speed_percentage}% DEMAND CONTROL {demand} NIGHT"
-
-        await self._post_json("/Timer", {"Value": command})
+        payload = _build_timer_payload(
+            duration_minutes, speed_percentage, demand_control
+        )
+        await self._post_json(self._url_timer, payload)
 
     async def cancel_timer(self) -> None:
         """Cancel active timer.
@@ -242,4 +665,46 @@ class QStreamClient:
             QStreamConnectionError: Cannot connect to device
             QStreamTimeoutError: Request timed out
         """
-        await self._post_json("/Timer", {"Value": "TIMER 0 MIN"})
+        await self._post_json(self._url_timer, _CANCEL_TIMER_PAYLOAD)
+
+
+class _SyncClient:
+    """Blocking wrapper running a QStreamClient on a private event loop."""
+
+    __slots__ = ("_client", "_runner")
+
+    def __init__(self, client: QStreamClient) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            client: Client to drive; its session is created on first use
+        """
+        self._client = client
+        self._runner = asyncio.Runner()
+
+    def __getattr__(self, name: str) -> Any:
+        """Return client attributes, making coroutine methods blocking."""
+        attr = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._runner.run(attr(*args, **kwargs))
+
+        return call
+
+    def close(self) -> None:
+        """Close the client, then the event loop it runs on."""
+        try:
+            self._runner.run(self._client.close())
+        finally:
+            self._runner.close()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Context manager exit."""
+        self.close()
@@ -1,20 +1,24 @@
 """Data models for QStream API responses."""
 
 from dataclasses import dataclass
-from enum import Enum
+from datetime import datetime
+from enum import StrEnum
 
 
-class ScheduleMode(str, Enum):
+class ScheduleMode(StrEnum):
     """Schedule mode based on time of day."""
 
     DAY = "DAY"
     NIGHT = "NIGHT"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QStreamStatus:
     """Parsed status from /Status endpoint.
 
+    Instances are immutable so the same object can safely be returned
+    for repeated polls of an unchanged device state.
+
     Attributes:
         timer_active: Whether timer is currently running
         timer_remaining_minutes: Minutes remaining on timer (None if inactive)
@@ -40,3 +44,20 @@ class QStreamStatus:
     demand_control_enabled: bool
     valve_open: bool
     raw_value: str
+
+
+@dataclass(slots=True, frozen=True)
+class QStreamSnapshot:
+    """Combined device readings fetched concurrently by snapshot().
+
+    Attributes:
+        status: Parsed status from /Status
+        air_quality: Air quality index from /AQI
+        nominal_flow: Nominal flow rate from /Qnom (e.g., "70%")
+        device_datetime: Device date and time from /DateTime
+    """
+
+    status: QStreamStatus
+    air_quality: int
+    nominal_flow: str
+    device_datetime: datetime
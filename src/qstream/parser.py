@@ -1,13 +1,88 @@
 """Parser for QStream API response strings."""
 
-import re
+from collections.abc import Callable
+from functools import lru_cache, partial
+from typing import Any
+
 from qstream.models import QStreamStatus, ScheduleMode
 from qstream.exceptions import QStreamResponseError
 
+# Enum members resolved once instead of looked up by value on every parse
+_DAY = ScheduleMode.DAY
+_NIGHT = ScheduleMode.NIGHT
+
+
+def _token(tokens: list[str], index: int) -> str:
+    """Return the token at index, or an empty string past the end."""
+    return tokens[index] if index < len(tokens) else ""
+
+
+def _number(token: str) -> int | None:
+    """Parse a token like "25" or "38%" into an integer (None if not numeric)."""
+    digits = token.removesuffix("%")
+    return int(digits) if digits.isdecimal() else None
+
+
+def _parse_timer(fields: dict[str, Any], tokens: list[str], index: int) -> None:
+    """Handle "TIMER ACTIVE <n> MIN" / "TIMER INACTIVE"."""
+    if _token(tokens, index + 1) == "ACTIVE":
+        fields["timer_active"] = True
+        fields["timer_remaining_minutes"] = _number(_token(tokens, index + 2))
+
+
+def _parse_schedule(fields: dict[str, Any], tokens: list[str], index: int) -> None:
+    """Handle "SCHEDULE ON <n> MIN" / "SCHEDULE OFF"."""
+    if _token(tokens, index + 1) == "ON":
+        fields["schedule_enabled"] = True
+        fields["schedule_remaining_minutes"] = _number(_token(tokens, index + 2))
+
+
+def _parse_flow(
+    name: str, fields: dict[str, Any], tokens: list[str], index: int
+) -> None:
+    """Handle "Qanalog <n>%", "Qset <n>%" and "Qactual <n>%"."""
+    fields[name] = _number(_token(tokens, index + 1))
+
+
+def _parse_demand(fields: dict[str, Any], tokens: list[str], index: int) -> None:
+    """Handle "DEMAND CONTROL ON" / "DEMAND CONTROL OFF"."""
+    fields["demand_control_enabled"] = (
+        _token(tokens, index + 1) == "CONTROL" and _token(tokens, index + 2) == "ON"
+    )
+
+
+def _parse_mode(
+    mode: ScheduleMode, fields: dict[str, Any], tokens: list[str], index: int
+) -> None:
+    """Handle the "DAY" / "NIGHT" schedule mode keyword."""
+    fields["schedule_mode"] = mode
+
+
+def _parse_valve(fields: dict[str, Any], tokens: list[str], index: int) -> None:
+    """Handle "VALVE OPEN" / "VALVE CLOSED"."""
+    fields["valve_open"] = _token(tokens, index + 1) == "OPEN"
+
+
+# Keyword dispatch table; each handler reads the tokens following its keyword
+_HANDLERS: dict[str, Callable[[dict[str, Any], list[str], int], None]] = {
+    "TIMER": _parse_timer,
+    "SCHEDULE": _parse_schedule,
+    "Qanalog": partial(_parse_flow, "analog_flow"),
+    "Qset": partial(_parse_flow, "set_flow"),
+    "Qactual": partial(_parse_flow, "actual_flow"),
+    "DEMAND": _parse_demand,
+    "DAY": partial(_parse_mode, _DAY),
+    "NIGHT": partial(_parse_mode, _NIGHT),
+    "VALVE": _parse_valve,
+}
+
 
 def parse_status(raw_value: str) -> QStreamStatus:
     """Parse status string from /Status endpoint.
 
+    Results are cached per status string, so repeated polls of an
+    unchanged device return the same (immutable) object.
+
     Args:
         raw_value: Raw status string from device
 
@@ -17,60 +92,46 @@ def parse_status(raw_value: str) -> QStreamStatus:
     Raises:
         QStreamResponseError: If status string format is invalid
     """
+    return _parse_status_cached(raw_value)
+
+
+@lru_cache(maxsize=64)
+def _parse_status_cached(raw_value: str) -> QStreamStatus:
+    """Parse a status string (uncached implementation of parse_status).
+
+    The string is split into tokens once and scanned in a single pass,
+    dispatching on known keywords. Errors are raised, not cached.
+    """
     try:
-        # Parse timer state
-        timer_active = "TIMER ACTIVE" in raw_value
-        timer_match = re.search(r"TIMER ACTIVE (\d+) MIN", raw_value)
-        timer_remaining_minutes = int(timer_match.group(1)) if timer_match else None
-
-        # Parse schedule state
-        schedule_enabled = "SCHEDULE ON" in raw_value
-        schedule_match = re.search(r"SCHEDULE ON (\d+) MIN", raw_value)
-        schedule_remaining_minutes = (
-            int(schedule_match.group(1)) if schedule_match else None
-        )
-
-        # Parse schedule mode (only if schedule enabled)
-        schedule_mode = None
-        if schedule_enabled:
-            if "DAY" in raw_value:
-                schedule_mode = ScheduleMode.DAY
-            elif "NIGHT" in raw_value:
-                schedule_mode = ScheduleMode.NIGHT
-
-        # Parse flow percentages
-        analog_match = re.search(r"Qanalog (\d+)%", raw_value)
-        set_match = re.search(r"Qset (\d+)%", raw_value)
-        actual_match = re.search(r"Qactual (\d+)%", raw_value)
-
-        if not all([analog_match, set_match, actual_match]):
+        tokens = raw_value.split()
+        fields: dict[str, Any] = {
+            "timer_active": False,
+            "timer_remaining_minutes": None,
+            "schedule_enabled": False,
+            "schedule_remaining_minutes": None,
+            "schedule_mode": None,
+            "analog_flow": None,
+            "set_flow": None,
+            "actual_flow": None,
+            "demand_control_enabled": False,
+            "valve_open": False,
+        }
+
+        for index, token in enumerate(tokens):
+            handler = _HANDLERS.get(token)
+            if handler:
+                handler(fields, tokens, index)
+
+        if None in (fields["analog_flow"], fields["set_flow"], fields["actual_flow"]):
             raise QStreamResponseError(
                 "Missing required flow values", raw_response=raw_value
             )
 
-        analog_flow = int(analog_match.group(1))
-        set_flow = int(set_match.group(1))
-        actual_flow = int(actual_match.group(1))
-
-        # Parse demand control
-        demand_control_enabled = "DEMAND CONTROL ON" in raw_value
-
-        # Parse valve state
-        valve_open = "VALVE OPEN" in raw_value
-
-        return QStreamStatus(
-            timer_active=timer_active,
-            timer_remaining_minutes=timer_remaining_minutes,
-            schedule_enabled=schedule_enabled,
-            schedule_remaining_minutes=schedule_remaining_minutes,
-            schedule_mode=schedule_mode,
-            analog_flow=analog_flow,
-            set_flow=set_flow,
-            actual_flow=actual_flow,
-            demand_control_enabled=demand_control_enabled,
-            valve_open=valve_open,
-            raw_value=raw_value,
-        )
+        # Schedule mode is only meaningful when the schedule is enabled
+        if not fields["schedule_enabled"]:
+            fields["schedule_mode"] = None
+
+        return QStreamStatus(**fields, raw_value=raw_value)
     except (AttributeError, ValueError) as e:
         raise QStreamResponseError(
             f"Failed to parse status string: {e}", raw_response=raw_value
@@ -1,8 +1,12 @@
 """Pytest fixtures for QStream tests."""
 
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 
 def pytest_addoption(parser):
@@ -55,6 +59,8 @@ def mock_response():
         response = AsyncMock(spec=aiohttp.ClientResponse)
         response.status = status
         response.json = AsyncMock(return_value=json_data)
+        body = b"" if json_data is None else json.dumps(json_data).encode()
+        response.read = AsyncMock(return_value=body)
         return response
 
     return _mock_response
@@ -65,3 +71,55 @@ def mock_session():
     """Create a mock aiohttp session."""
     session = AsyncMock(spec=aiohttp.ClientSession)
     return session
+
+
+@pytest.fixture
+def last_posted_value(mock_session):
+    """Return a helper decoding the "Value" of the last body sent to mock_session."""
+
+    def _get() -> str:
+        return json.loads(mock_session.request.call_args.kwargs["data"])["Value"]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+async def fake_device_server():
+    """Run an in-process fake QStream device for the whole test session.
+
+    The returned namespace has the device ``host``, the ``values`` served
+    per endpoint (e.g. ``values["/Levels?index=1"] = "38%"``) and the
+    timer commands ``posted`` to /Timer.
+    """
+    values = {}
+    posted = []
+
+    async def get_value(request):
+        return web.json_response({"Value": values[request.path_qs]})
+
+    async def post_timer(request):
+        if request.content_type != "application/json":
+            raise web.HTTPUnsupportedMediaType()
+        data = await request.json()
+        posted.append(data["Value"])
+        return web.json_response(data)
+
+    app = web.Application()
+    app.router.add_get("/{endpoint}", get_value)
+    app.router.add_post("/Timer", post_timer)
+    server = TestServer(app)
+    await server.start_server()
+
+    yield SimpleNamespace(
+        host=f"{server.host}:{server.port}", values=values, posted=posted
+    )
+
+    await server.close()
+
+
+@pytest.fixture
+def fake_device(fake_device_server):
+    """Provide the fake QStream device with values and posts reset."""
+    fake_device_server.values.clear()
+    fake_device_server.posted.clear()
+    return fake_device_server
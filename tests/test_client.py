@@ -1,11 +1,14 @@
 """Tests for QStream HTTP client."""
 
+import asyncio
+import json
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, patch, sentinel
 from datetime import datetime
 import aiohttp
+from yarl import URL
 from qstream.client import QStreamClient
-from qstream.models import QStreamStatus, ScheduleMode
+from qstream.models import QStreamSnapshot, QStreamStatus, ScheduleMode
 from qstream.exceptions import (
     QStreamConnectionError,
     QStreamTimeoutError,
@@ -34,68 +37,199 @@ def test_client_init_with_external_session():
     assert client._owned_session is False
 
 
+@pytest.mark.asyncio
+async def test_shared_session_reused_across_clients():
+    """shared_session should return one session that clients do not close."""
+    session = QStreamClient.shared_session()
+    try:
+        assert QStreamClient.shared_session() is session
+
+        async with QStreamClient("192.168.1.100", session=session) as client:
+            assert client._owned_session is False
+
+        assert not session.closed
+    finally:
+        await QStreamClient.close_shared_session()
+
+    assert session.closed
+    assert QStreamClient.shared_session() is not session
+    await QStreamClient.close_shared_session()
+
+
+def test_shared_session_replaced_after_event_loop_closes():
+    """shared_session should replace a session whose event loop has ended."""
+
+    async def open_shared():
+        return QStreamClient.shared_session()
+
+    async def reopen_shared():
+        session = QStreamClient.shared_session()
+        await asyncio.sleep(0)
+        await QStreamClient.close_shared_session()
+        return session
+
+    first = asyncio.run(open_shared())
+    second = asyncio.run(reopen_shared())
+
+    assert second is not first
+    assert first.closed
+    assert second.closed
+
+
+def test_shared_session_rejects_other_event_loop():
+    """shared_session should not orphan an open session from another loop."""
+
+    async def open_shared():
+        return QStreamClient.shared_session()
+
+    with asyncio.Runner() as runner:
+        session = runner.run(open_shared())
+        try:
+            with pytest.raises(RuntimeError, match="close_shared_session"):
+                asyncio.run(open_shared())
+            assert QStreamClient._shared_session is session
+        finally:
+            runner.run(QStreamClient.close_shared_session())
+
+
+def test_sync_client_reuses_one_event_loop():
+    """sync() should run calls on one loop and close the client on exit."""
+    loops = []
+
+    async def get_air_quality():
+        loops.append(asyncio.get_running_loop())
+        return 42
+
+    with (
+        patch.object(QStreamClient, "get_air_quality", side_effect=get_air_quality),
+        patch.object(QStreamClient, "close") as close,
+        QStreamClient.sync("192.168.1.100", timeout=30) as client,
+    ):
+        assert client.get_air_quality() == 42
+        assert client.get_air_quality() == 42
+        assert client._timeout.total == 30
+
+    assert loops[0] is loops[1]
+    assert loops[0].is_closed()
+    close.assert_awaited_once()
+
+
 def test_client_init_with_timeout():
     """Client should accept custom timeout."""
     client = QStreamClient("192.168.1.100", timeout=30)
     assert client._timeout.total == 30
 
 
+def test_client_uses_slots():
+    """Client should use slots instead of a per-instance __dict__."""
+    client = QStreamClient("192.168.1.100")
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client._unknown = True
+
+
 @pytest.mark.asyncio
-async def test_get_status_success(mock_session, mock_response):
+async def test_get_status_success(fake_device):
     """get_status should parse status response."""
-    raw = "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": raw}
+    fake_device.values["/Status"] = (
+        "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
     )
 
-    client = QStreamClient("192.168.1.100", session=mock_session)
-    status = await client.get_status()
+    async with QStreamClient(fake_device.host) as client:
+        status = await client.get_status()
 
     assert isinstance(status, QStreamStatus)
     assert status.set_flow == 20
     assert status.actual_flow == 20
-    mock_session.get.assert_called_once_with(
-        "http://192.168.1.100/Status", timeout=client._timeout
+
+
+@pytest.mark.asyncio
+async def test_get_status_unchanged_body_skips_parse(mock_session, mock_response):
+    """get_status should reuse the last status when the body is unchanged."""
+    raw = "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": raw}
     )
 
+    client = QStreamClient("192.168.1.100", session=mock_session)
+    first = await client.get_status()
+
+    with patch("qstream.client.parse_status") as parse:
+        second = await client.get_status()
+
+    parse.assert_not_called()
+    assert second is first
+    assert mock_session.request.call_count == 2
+
 
 @pytest.mark.asyncio
-async def test_get_air_quality_success(mock_session, mock_response):
+async def test_get_air_quality_success(fake_device):
     """get_air_quality should return integer AQI value."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "16"}
+    fake_device.values["/AQI"] = "16"
+
+    async with QStreamClient(fake_device.host) as client:
+        aqi = await client.get_air_quality()
+
+    assert aqi == 16
+    assert isinstance(aqi, int)
+
+
+@pytest.mark.asyncio
+async def test_get_air_quality_numeric_value(mock_session, mock_response):
+    """get_air_quality should fall back to JSON decoding for non-string values."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": 16}
     )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
     aqi = await client.get_air_quality()
 
     assert aqi == 16
-    assert isinstance(aqi, int)
 
 
 @pytest.mark.asyncio
-async def test_get_nominal_flow_success(mock_session, mock_response):
-    """get_nominal_flow should return percentage string."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "70%"}
+async def test_get_air_quality_empty_body(mock_session, mock_response):
+    """get_air_quality should return the default for an empty response body."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response()
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+    aqi = await client.get_air_quality()
+
+    assert aqi == 0
+
+
+@pytest.mark.asyncio
+async def test_get_nominal_flow_escaped_value(mock_session, mock_response):
+    """Values containing JSON escapes should be decoded by the JSON fallback."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": 'say "70%" caf\u00e9'}
     )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
     qnom = await client.get_nominal_flow()
 
+    assert qnom == 'say "70%" caf\u00e9'
+
+
+@pytest.mark.asyncio
+async def test_get_nominal_flow_success(fake_device):
+    """get_nominal_flow should return percentage string."""
+    fake_device.values["/Qnom"] = "70%"
+
+    async with QStreamClient(fake_device.host) as client:
+        qnom = await client.get_nominal_flow()
+
     assert qnom == "70%"
     assert isinstance(qnom, str)
 
 
 @pytest.mark.asyncio
-async def test_get_datetime_success(mock_session, mock_response):
+async def test_get_datetime_success(fake_device):
     """get_datetime should parse datetime string."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "24/10/2025 23:19:05"}
-    )
+    fake_device.values["/DateTime"] = "24/10/2025 23:19:05"
 
-    client = QStreamClient("192.168.1.100", session=mock_session)
-    dt = await client.get_datetime()
+    async with QStreamClient(fake_device.host) as client:
+        dt = await client.get_datetime()
 
     assert isinstance(dt, datetime)
     assert dt.year == 2025
@@ -107,92 +241,262 @@ async def test_get_datetime_success(mock_session, mock_response):
 
 
 @pytest.mark.asyncio
-async def test_get_level_success(mock_session, mock_response):
+async def test_get_level_success(fake_device):
     """get_level should return percentage as integer."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
+    fake_device.values["/Levels?index=1"] = "38%"
+
+    async with QStreamClient(fake_device.host) as client:
+        level = await client.get_level(1)
+
+    assert level == 38
+    assert isinstance(level, int)
+
+
+@pytest.mark.asyncio
+async def test_owned_session_uses_session_timeout(mock_session, mock_response):
+    """Requests on an owned session should rely on the session-level timeout."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
         json_data={"Value": "38%"}
     )
 
+    client = QStreamClient("192.168.1.100")
+    client._session = mock_session
+    await client.get_level(1)
+
+    mock_session.request.assert_called_once_with(
+        "GET", URL("http://192.168.1.100/Levels?index=1")
+    )
+
+
+@pytest.mark.parametrize("index", [5, -1])
+@pytest.mark.asyncio
+async def test_get_level_outside_precomputed_urls(mock_session, mock_response, index):
+    """get_level should build the URL for indexes without a precomputed URL."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": "50%"}
+    )
+
     client = QStreamClient("192.168.1.100", session=mock_session)
-    level = await client.get_level(1)
+    await client.get_level(index)
 
-    assert level == 38
-    assert isinstance(level, int)
-    mock_session.get.assert_called_once_with(
-        "http://192.168.1.100/Levels?index=1", timeout=client._timeout
+    mock_session.request.assert_called_once_with(
+        "GET",
+        URL(f"http://192.168.1.100/Levels?index={index}"),
+        timeout=client._timeout,
     )
 
 
 @pytest.mark.asyncio
-async def test_get_level_zero(mock_session, mock_response):
-    """get_level should support level 0 (minimum continuous ventilation)."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "25%"}
+async def test_get_level_numeric_value(mock_session, mock_response):
+    """get_level should accept a level sent as a JSON number."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": 38}
     )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
-    level = await client.get_level(0)
+    level = await client.get_level(1)
+
+    assert level == 38
+
+
+@pytest.mark.asyncio
+async def test_get_level_zero(fake_device):
+    """get_level should support level 0 (minimum continuous ventilation)."""
+    fake_device.values["/Levels?index=0"] = "25%"
+
+    async with QStreamClient(fake_device.host) as client:
+        level = await client.get_level(0)
 
     assert level == 25
     assert isinstance(level, int)
-    mock_session.get.assert_called_once_with(
-        "http://192.168.1.100/Levels?index=0", timeout=client._timeout
+
+
+@pytest.mark.asyncio
+async def test_get_all_levels_success(fake_device):
+    """get_all_levels should fetch every preset level."""
+    for i, value in enumerate(["25%", "38%", "50%", "75%", "100%"]):
+        fake_device.values[f"/Levels?index={i}"] = value
+
+    async with QStreamClient(fake_device.host) as client:
+        levels = await client.get_all_levels()
+
+    assert levels == [25, 38, 50, 75, 100]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_combines_readings():
+    """snapshot should combine status, AQI, nominal flow and datetime."""
+    status = sentinel.status
+    device_datetime = datetime(2025, 10, 24, 23, 19, 5)
+    client = QStreamClient("192.168.1.100")
+
+    with (
+        patch.object(QStreamClient, "get_status", AsyncMock(return_value=status)),
+        patch.object(QStreamClient, "get_air_quality", AsyncMock(return_value=16)),
+        patch.object(QStreamClient, "get_nominal_flow", AsyncMock(return_value="70%")),
+        patch.object(
+            QStreamClient, "get_datetime", AsyncMock(return_value=device_datetime)
+        ),
+    ):
+        snapshot = await client.snapshot()
+
+    assert snapshot == QStreamSnapshot(
+        status=status,
+        air_quality=16,
+        nominal_flow="70%",
+        device_datetime=device_datetime,
     )
 
 
 @pytest.mark.asyncio
-async def test_set_timer_success(mock_session, mock_response):
+async def test_set_timer_success(fake_device):
     """set_timer should post timer command."""
-    mock_session.post.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "TIMER 30 MIN 50% DEMAND CONTROL OFF NIGHT"}
-    )
+    async with QStreamClient(fake_device.host) as client:
+        await client.set_timer(duration_minutes=30, speed_percentage=50)
+
+    assert len(fake_device.posted) == 1
+    assert "TIMER 30 MIN 50%" in fake_device.posted[0]
+    assert "DEMAND CONTROL OFF" in fake_device.posted[0]
+
+
+@pytest.mark.asyncio
+async def test_set_timer_with_demand_control(fake_device):
+    """set_timer should support demand control parameter."""
+    async with QStreamClient(fake_device.host) as client:
+        await client.set_timer(
+            duration_minutes=15, speed_percentage=75, demand_control=True
+        )
+
+    assert "DEMAND CONTROL ON" in fake_device.posted[0]
+
+
+@pytest.mark.asyncio
+async def test_cancel_timer_body_is_compact_json(mock_session, mock_response):
+    """Timer bodies should be compact JSON with either JSON backend."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response()
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+    await client.cancel_timer()
+
+    assert mock_session.request.call_args.kwargs["data"] == b'{"Value":"TIMER 0 MIN"}'
+
+
+@pytest.mark.asyncio
+async def test_set_timer_ignores_response_body(
+    mock_session, mock_response, last_posted_value
+):
+    """set_timer should not decode the acknowledgement body."""
+    response = mock_response()
+    response.read.return_value = b"OK"
+    mock_session.request.return_value.__aenter__.return_value = response
 
     client = QStreamClient("192.168.1.100", session=mock_session)
     await client.set_timer(duration_minutes=30, speed_percentage=50)
 
-    mock_session.post.assert_called_once()
-    call_args = mock_session.post.call_args
-    assert call_args[0][0] == "http://192.168.1.100/Timer"
-    assert "TIMER 30 MIN 50%" in call_args[1]["json"]["Value"]
-    assert "DEMAND CONTROL OFF" in call_args[1]["json"]["Value"]
+    response.read.assert_awaited_once()
+    assert "TIMER 30 MIN 50%" in last_posted_value()
 
 
 @pytest.mark.asyncio
-async def test_set_timer_with_demand_control(mock_session, mock_response):
-    """set_timer should support demand control parameter."""
-    mock_session.post.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "TIMER 15 MIN 75% DEMAND CONTROL ON NIGHT"}
-    )
+async def test_set_timer_reuses_encoded_body(
+    mock_session, mock_response, last_posted_value
+):
+    """Repeating a timer preset should reuse the same encoded body."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response()
 
     client = QStreamClient("192.168.1.100", session=mock_session)
     await client.set_timer(
-        duration_minutes=15, speed_percentage=75, demand_control=True
+        duration_minutes=30, speed_percentage=50, demand_control=True
+    )
+    first = mock_session.request.call_args.kwargs["data"]
+    await client.set_timer(
+        duration_minutes=30, speed_percentage=50, demand_control=True
     )
 
-    call_args = mock_session.post.call_args
-    assert "DEMAND CONTROL ON" in call_args[1]["json"]["Value"]
+    assert mock_session.request.call_args.kwargs["data"] is first
+    assert "DEMAND CONTROL ON" in last_posted_value()
 
 
 @pytest.mark.asyncio
-async def test_cancel_timer_success(mock_session, mock_response):
+async def test_cancel_timer_success(fake_device):
     """cancel_timer should post timer 0 command."""
-    mock_session.post.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "TIMER 0 MIN"}
-    )
+    async with QStreamClient(fake_device.host) as client:
+        await client.cancel_timer()
+
+    assert fake_device.posted == ["TIMER 0 MIN"]
 
+
+@pytest.mark.asyncio
+async def test_batch_sends_last_write_per_endpoint(fake_device):
+    """batch should buffer writes and send only the last one per endpoint."""
+    async with QStreamClient(fake_device.host) as client, client.batch():
+        await client.set_timer(duration_minutes=30, speed_percentage=50)
+        await client.cancel_timer()
+        assert fake_device.posted == []
+
+    assert fake_device.posted == ["TIMER 0 MIN"]
+
+
+@pytest.mark.asyncio
+async def test_batch_discards_writes_on_error(mock_session):
+    """batch should not send buffered writes if the block raises."""
     client = QStreamClient("192.168.1.100", session=mock_session)
-    await client.cancel_timer()
 
-    mock_session.post.assert_called_once()
-    call_args = mock_session.post.call_args
-    assert call_args[0][0] == "http://192.168.1.100/Timer"
-    assert call_args[1]["json"]["Value"] == "TIMER 0 MIN"
+    with pytest.raises(RuntimeError):
+        async with client.batch():
+            await client.set_timer(duration_minutes=30, speed_percentage=50)
+            raise RuntimeError("abort")
+
+    mock_session.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_does_not_buffer_other_tasks(fake_device):
+    """Writes from another task during an open batch should be sent at once."""
+    batch_open = asyncio.Event()
+
+    async def other_task(client):
+        await batch_open.wait()
+        await client.set_timer(duration_minutes=60, speed_percentage=100)
+
+    async with QStreamClient(fake_device.host) as client:
+        task = asyncio.create_task(other_task(client))
+        with pytest.raises(RuntimeError):
+            async with client.batch():
+                await client.set_timer(duration_minutes=30, speed_percentage=50)
+                batch_open.set()
+                await task
+                raise RuntimeError("abort")
+
+    assert fake_device.posted == ["TIMER 60 MIN 100% DEMAND CONTROL OFF NIGHT"]
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_child_task_writes_after_exit(mock_session, mock_response):
+    """Writes from a task started in a batch should be sent once the batch exits."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response()
+    client = QStreamClient("192.168.1.100", session=mock_session)
+    batch_done = asyncio.Event()
+
+    async def child_task():
+        await batch_done.wait()
+        await client.set_timer(duration_minutes=30, speed_percentage=50)
+
+    async with client.batch():
+        task = asyncio.create_task(child_task())
+
+    batch_done.set()
+    await task
+
+    assert mock_session.request.call_count == 1
 
 
 @pytest.mark.asyncio
 async def test_get_status_connection_error(mock_session):
     """Should raise QStreamConnectionError on connection failure."""
-    mock_session.get.side_effect = aiohttp.ClientConnectionError("Connection failed")
+    mock_session.request.side_effect = aiohttp.ClientConnectionError(
+        "Connection failed"
+    )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -205,7 +509,7 @@ async def test_get_status_connection_error(mock_session):
 @pytest.mark.asyncio
 async def test_get_status_timeout_error(mock_session):
     """Should raise QStreamTimeoutError on timeout."""
-    mock_session.get.side_effect = TimeoutError("Request timeout")
+    mock_session.request.side_effect = TimeoutError("Request timeout")
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -218,7 +522,7 @@ async def test_get_status_timeout_error(mock_session):
 @pytest.mark.asyncio
 async def test_get_status_invalid_json(mock_session, mock_response):
     """Should raise QStreamResponseError on invalid status format."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
         json_data={"Value": "INVALID FORMAT"}
     )
 
@@ -234,7 +538,7 @@ async def test_get_status_invalid_json(mock_session, mock_response):
 async def test_context_manager(mock_session, mock_response):
     """Client should work as async context manager."""
     raw = "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
         json_data={"Value": raw}
     )
     mock_session.close = AsyncMock()
@@ -253,12 +557,12 @@ async def test_context_manager_owned_session():
     client = QStreamClient("192.168.1.100")
 
     async with client:
-        # Create session manually for testing
-        client._session = AsyncMock(spec=aiohttp.ClientSession)
-        client._session.close = AsyncMock()
+        # Session is created eagerly on entry
+        assert isinstance(client._session, aiohttp.ClientSession)
+        assert client._session.timeout is client._timeout
 
     # Owned session should be closed
-    client._session.close.assert_called_once()
+    assert client._session.closed
 
 
 @pytest.mark.asyncio
@@ -276,7 +580,7 @@ async def test_get_status_http_error(mock_session):
         history=None,
         status=404
     )
-    mock_session.get.side_effect = error
+    mock_session.request.side_effect = error
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -287,23 +591,103 @@ async def test_get_status_http_error(mock_session):
 
 
 @pytest.mark.asyncio
-async def test_get_status_unexpected_error(mock_session):
-    """Should raise QStreamResponseError on unexpected error."""
-    mock_session.get.side_effect = ValueError("Unexpected issue")
+async def test_get_status_payload_error(mock_session):
+    """Should raise QStreamResponseError on a malformed response payload."""
+    mock_session.request.side_effect = aiohttp.ClientPayloadError("Truncated body")
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
     with pytest.raises(QStreamResponseError) as exc_info:
         await client.get_status()
 
-    assert "Unexpected error" in str(exc_info.value)
+    assert "Invalid response" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_get_air_quality_invalid_value(mock_session, mock_response):
-    """Should raise QStreamResponseError on invalid AQI value."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
-        json_data={"Value": "not_a_number"}
+async def test_get_air_quality_invalid_json(mock_session, mock_response):
+    """Should raise QStreamResponseError when the body is not valid JSON."""
+    response = mock_response()
+    response.read.return_value = b"<html>error</html>"
+    mock_session.request.return_value.__aenter__.return_value = response
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+
+    with pytest.raises(QStreamResponseError) as exc_info:
+        await client.get_air_quality()
+
+    assert "Invalid JSON response" in str(exc_info.value)
+    assert exc_info.value.raw_response == "<html>error</html>"
+
+
+@pytest.mark.parametrize("value", [None, True, {"a": 1}, 2.5])
+@pytest.mark.asyncio
+async def test_get_nominal_flow_non_scalar_value(mock_session, mock_response, value):
+    """Should reject JSON values that are neither strings nor integers."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": value}
+    )
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+
+    with pytest.raises(QStreamResponseError) as exc_info:
+        await client.get_nominal_flow()
+
+    assert exc_info.value.raw_response == json.dumps({"Value": value})
+
+
+@pytest.mark.parametrize("body", [b'{"Value": "\xff"}', b"[1]", b"null"])
+@pytest.mark.asyncio
+async def test_get_air_quality_malformed_body(mock_session, mock_response, body):
+    """Should raise QStreamResponseError on non-UTF-8 or non-object bodies."""
+    response = mock_response()
+    response.read.return_value = body
+    mock_session.request.return_value.__aenter__.return_value = response
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+
+    with pytest.raises(QStreamResponseError) as exc_info:
+        await client.get_air_quality()
+
+    assert exc_info.value.raw_response == body.decode(errors="replace")
+
+
+@pytest.mark.asyncio
+async def test_get_status_unexpected_error(mock_session):
+    """Should not wrap errors unrelated to the HTTP exchange."""
+    mock_session.request.side_effect = ValueError("Unexpected issue")
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+
+    with pytest.raises(ValueError, match="Unexpected issue"):
+        await client.get_status()
+
+
+@pytest.mark.asyncio
+async def test_get_status_cancellation_propagates(mock_session):
+    """Cancelling a pending request should raise CancelledError, not a QStream error."""
+    started = asyncio.Event()
+
+    async def hang(*args):
+        started.set()
+        await asyncio.Event().wait()
+
+    mock_session.request.return_value.__aenter__.side_effect = hang
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+    task = asyncio.create_task(client.get_status())
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.parametrize("value", ["not_a_number", "16%"])
+@pytest.mark.asyncio
+async def test_get_air_quality_invalid_value(mock_session, mock_response, value):
+    """Should raise QStreamResponseError on invalid (or percentage) AQI value."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": value}
     )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
@@ -317,7 +701,7 @@ async def test_get_air_quality_invalid_value(mock_session, mock_response):
 @pytest.mark.asyncio
 async def test_get_datetime_invalid_format(mock_session, mock_response):
     """Should raise QStreamResponseError on invalid datetime format."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
         json_data={"Value": "not a valid datetime"}
     )
 
@@ -330,10 +714,35 @@ async def test_get_datetime_invalid_format(mock_session, mock_response):
     assert exc_info.value.raw_response == "not a valid datetime"
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "24-10-2025 23:19:05",
+        "24/10/2025 23:19:05 UTC",
+        "24/10/25 23:19",
+        "+4/10/2025 23:19:05",
+        "24/10/2025 +3:19:05",
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_datetime_unexpected_layout(mock_session, mock_response, value):
+    """Should reject datetimes that do not match dd/mm/YYYY HH:MM:SS."""
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
+        json_data={"Value": value}
+    )
+
+    client = QStreamClient("192.168.1.100", session=mock_session)
+
+    with pytest.raises(QStreamResponseError) as exc_info:
+        await client.get_datetime()
+
+    assert exc_info.value.raw_response == value
+
+
 @pytest.mark.asyncio
 async def test_get_level_invalid_value(mock_session, mock_response):
     """Should raise QStreamResponseError on invalid level value."""
-    mock_session.get.return_value.__aenter__.return_value = mock_response(
+    mock_session.request.return_value.__aenter__.return_value = mock_response(
         json_data={"Value": "invalid%"}
     )
 
@@ -349,7 +758,9 @@ async def test_get_level_invalid_value(mock_session, mock_response):
 @pytest.mark.asyncio
 async def test_set_timer_connection_error(mock_session):
     """Should raise QStreamConnectionError on POST connection failure."""
-    mock_session.post.side_effect = aiohttp.ClientConnectionError("Connection failed")
+    mock_session.request.side_effect = aiohttp.ClientConnectionError(
+        "Connection failed"
+    )
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -367,7 +778,7 @@ async def test_set_timer_http_error(mock_session):
         history=None,
         status=500
     )
-    mock_session.post.side_effect = error
+    mock_session.request.side_effect = error
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -380,7 +791,7 @@ async def test_set_timer_http_error(mock_session):
 @pytest.mark.asyncio
 async def test_set_timer_timeout(mock_session):
     """Should raise QStreamTimeoutError on POST timeout."""
-    mock_session.post.side_effect = TimeoutError("Request timeout")
+    mock_session.request.side_effect = TimeoutError("Request timeout")
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
@@ -392,12 +803,10 @@ async def test_set_timer_timeout(mock_session):
 
 @pytest.mark.asyncio
 async def test_set_timer_unexpected_error(mock_session):
-    """Should raise QStreamResponseError on POST unexpected error."""
-    mock_session.post.side_effect = ValueError("Unexpected issue")
+    """Should not wrap POST errors unrelated to the HTTP exchange."""
+    mock_session.request.side_effect = ValueError("Unexpected issue")
 
     client = QStreamClient("192.168.1.100", session=mock_session)
 
-    with pytest.raises(QStreamResponseError) as exc_info:
+    with pytest.raises(ValueError, match="Unexpected issue"):
         await client.set_timer(30, 50)
-
-    assert "Unexpected error" in str(exc_info.value)
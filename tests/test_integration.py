@@ -39,11 +39,11 @@ async def test_get_air_quality_real_device(device_ip):
 async def test_get_levels_real_device(device_ip):
     """Test get_level for all preset levels (0-4)."""
     async with QStreamClient(device_ip) as client:
-        levels = {}
-        for i in range(0, 5):
-            level = await client.get_level(i)
+        levels = await client.get_all_levels()
+
+        assert len(levels) == 5
+        for level in levels:
             assert isinstance(level, int)
             assert 0 <= level <= 100
-            levels[i] = level
 
         print(f"\nPreset levels: {levels}")
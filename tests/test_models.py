@@ -1,5 +1,6 @@
 """Tests for QStream data models."""
 
+import dataclasses
 import pytest
 from qstream.models import ScheduleMode, QStreamStatus
 
@@ -16,6 +17,12 @@ def test_schedule_mode_is_string():
     assert isinstance(ScheduleMode.NIGHT.value, str)
 
 
+def test_schedule_mode_str_is_value():
+    """ScheduleMode should format as its plain value."""
+    assert str(ScheduleMode.DAY) == "DAY"
+    assert f"{ScheduleMode.NIGHT}" == "NIGHT"
+
+
 def test_qstream_status_dataclass_creation():
     """QStreamStatus should be creatable with all fields."""
     status = QStreamStatus(
@@ -64,3 +71,29 @@ def test_qstream_status_with_schedule_mode():
     assert status.schedule_enabled is True
     assert status.schedule_mode == ScheduleMode.NIGHT
     assert status.schedule_remaining_minutes == 25
+
+
+def test_qstream_status_is_immutable():
+    """QStreamStatus should be frozen so cached instances cannot be modified."""
+    status = QStreamStatus(
+        timer_active=False,
+        timer_remaining_minutes=None,
+        schedule_enabled=False,
+        schedule_remaining_minutes=None,
+        schedule_mode=None,
+        analog_flow=0,
+        set_flow=20,
+        actual_flow=20,
+        demand_control_enabled=True,
+        valve_open=False,
+        raw_value="TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED",
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        status.set_flow = 50
+
+
+def test_qstream_status_uses_slots():
+    """QStreamStatus should use slots instead of a per-instance __dict__."""
+    assert "__slots__" in vars(QStreamStatus)
+    assert not hasattr(QStreamStatus.__new__(QStreamStatus), "__dict__")
@@ -80,3 +80,45 @@ def test_parse_status_schedule_day_mode():
     assert status.schedule_enabled is True
     assert status.schedule_mode == ScheduleMode.DAY
     assert status.schedule_remaining_minutes == 15
+
+
+def test_parse_status_timer_and_schedule_active():
+    """Should parse status with both timer and schedule active."""
+    raw = "TIMER ACTIVE 5 MIN SCHEDULE ON 10 MIN Qanalog 0% Qset 50% Qactual 45% DEMAND CONTROL OFF NIGHT VALVE CLOSED"
+    status = parse_status(raw)
+
+    assert status.timer_active is True
+    assert status.timer_remaining_minutes == 5
+    assert status.schedule_enabled is True
+    assert status.schedule_remaining_minutes == 10
+    assert status.schedule_mode == ScheduleMode.NIGHT
+    assert status.set_flow == 50
+    assert status.actual_flow == 45
+
+
+def test_parse_status_non_numeric_flow():
+    """Should raise QStreamResponseError when a flow value is not a number."""
+    raw = "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset abc% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
+
+    with pytest.raises(QStreamResponseError) as exc_info:
+        parse_status(raw)
+
+    assert "Missing required flow values" in str(exc_info.value)
+
+
+def test_parse_status_reuses_result_for_identical_string():
+    """Should return the cached status for a repeated status string."""
+    raw = "TIMER INACTIVE SCHEDULE OFF Qanalog 0% Qset 20% Qactual 20% DEMAND CONTROL ON DAY VALVE CLOSED"
+
+    assert parse_status(raw) is parse_status(raw)
+
+
+def test_parse_status_truncated_and_unknown_tokens():
+    """Should ignore unknown tokens and tolerate a keyword at the end of the string."""
+    raw = "FIRMWARE X1 Qanalog 0% Qset 20% Qactual 20% VALVE OPEN TIMER ACTIVE"
+    status = parse_status(raw)
+
+    assert status.valve_open is True
+    assert status.timer_active is True
+    assert status.timer_remaining_minutes is None
+    assert status.actual_flow == 20